@@ -7,7 +7,6 @@ from river.anomaly.base import AnomalyDetector
 from torch import nn
 
 from deep_river.base import DeepEstimator
-from deep_river.utils import dict2tensor
 from deep_river.utils.tensor_conversion import df2tensor
 
 
@@ -18,7 +17,7 @@ class _TestAutoencoder(torch.nn.Module):
         self.nonlin = torch.nn.LeakyReLU()
         self.linear2 = nn.Linear(latent_dim, n_features)
 
-    def forward(self, X, **kwargs):
+    def forward(self, X):
         X = self.linear1(X)
         X = self.nonlin(X)
         X = self.linear2(X)
@@ -52,6 +51,12 @@ class Autoencoder(DeepEstimator, AnomalyDetector):
         Device to run the wrapped model on. Can be "cpu" or "cuda".
     seed
         Random seed to be used for training the wrapped model.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
     **kwargs
         Parameters to be passed to the `torch.Module` class
         aside from `n_features`.
@@ -77,7 +82,7 @@ class Autoencoder(DeepEstimator, AnomalyDetector):
     ...         self.linear2 = nn.Linear(latent_dim, n_features)
     ...         self.sigmoid = nn.Sigmoid()
     ...
-    ...     def forward(self, X, **kwargs):
+    ...     def forward(self, X):
     ...         X = self.linear1(X)
     ...         X = self.nonlin(X)
     ...         X = self.linear2(X)
@@ -104,6 +109,7 @@ class Autoencoder(DeepEstimator, AnomalyDetector):
         lr: float = 1e-3,
         device: str = "cpu",
         seed: int = 42,
+        jit: bool = False,
         **kwargs,
     ):
         super().__init__(
@@ -113,6 +119,7 @@ class Autoencoder(DeepEstimator, AnomalyDetector):
             lr=lr,
             device=device,
             seed=seed,
+            jit=jit,
             **kwargs,
         )
 
@@ -175,10 +182,11 @@ class Autoencoder(DeepEstimator, AnomalyDetector):
         if not self.module_initialized:
             self.kwargs["n_features"] = len(x)
             self.initialize_module(**self.kwargs)
-        return self._learn(dict2tensor(x, device=self.device))
+        return self._learn(self._dict2tensor(x))
 
     def _learn(self, x: torch.Tensor) -> "Autoencoder":
-        self.module.train()
+        if not self.module.training:
+            self.module.train()
         x_pred = self.module(x)
         loss = self.loss_fn(x_pred, x)
         loss.backward()
@@ -208,9 +216,10 @@ class Autoencoder(DeepEstimator, AnomalyDetector):
             self.kwargs["n_features"] = len(x)
             self.initialize_module(**self.kwargs)
 
-        x_t = dict2tensor(x, device=self.device)
-        self.module.eval()
-        with torch.inference_mode():
+        x_t = self._dict2tensor(x)
+        if self.module.training:
+            self.module.eval()
+        with self._no_grad():
             x_pred = self.module(x_t)
         loss = self.loss_fn(x_pred, x_t).item()
         return loss
@@ -257,8 +266,9 @@ class Autoencoder(DeepEstimator, AnomalyDetector):
             self.initialize_module(**self.kwargs)
         X = df2tensor(X, device=self.device)
 
-        self.module.eval()
-        with torch.inference_mode():
+        if self.module.training:
+            self.module.eval()
+        with self._no_grad():
             X_pred = self.module(X)
         loss = torch.mean(
             self.loss_fn(X_pred, X, reduction="none"),
@@ -45,6 +45,12 @@ class ProbabilityWeightedAutoencoder(ae.Autoencoder):
         Device to run the wrapped model on. Can be "cpu" or "cuda".
     seed
         Random seed to be used for training the wrapped model.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
     **kwargs
         Parameters to be passed to the `module` function
         aside from `n_features`.
@@ -100,6 +106,7 @@ class ProbabilityWeightedAutoencoder(ae.Autoencoder):
         seed: int = 42,
         skip_threshold: float = 0.9,
         window_size=250,
+        jit: bool = False,
         **kwargs,
     ):
         super().__init__(
@@ -109,6 +116,7 @@ class ProbabilityWeightedAutoencoder(ae.Autoencoder):
             lr=lr,
             device=device,
             seed=seed,
+            jit=jit,
             **kwargs,
         )
         self.window_size = window_size
@@ -140,9 +148,10 @@ class ProbabilityWeightedAutoencoder(ae.Autoencoder):
         if not self.module_initialized:
             self.kwargs["n_features"] = len(x)
             self.initialize_module(**self.kwargs)
-        x_t = dict2tensor(x, device=self.device)
+        x_t = self._dict2tensor(x)
 
-        self.module.train()
+        if not self.module.training:
+            self.module.train()
         x_pred = self.module(x_t)
         loss = self.loss_fn(x_pred, x_t)
         self._apply_loss(loss)
@@ -177,7 +186,8 @@ class ProbabilityWeightedAutoencoder(ae.Autoencoder):
             self.initialize_module(**self.kwargs)
         X = dict2tensor(X.to_dict(), device=self.device)
 
-        self.module.train()
+        if not self.module.training:
+            self.module.train()
         x_pred = self.module(X)
         loss = torch.mean(
             self.loss_fn(x_pred, X, reduction="none"),
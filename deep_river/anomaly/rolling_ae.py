@@ -76,6 +76,12 @@ class RollingAutoencoder(RollingDeepEstimator, anomaly.base.AnomalyDetector):
         Size of the rolling window used for storing previous examples.
     append_predict
         Whether to append inputs passed for prediction to the rolling window.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
     **kwargs
         Parameters to be passed to the `Module` or the `optimizer`.
     """
@@ -90,6 +96,7 @@ class RollingAutoencoder(RollingDeepEstimator, anomaly.base.AnomalyDetector):
         seed: int = 42,
         window_size: int = 10,
         append_predict: bool = False,
+        jit: bool = False,
         **kwargs,
     ):
         super().__init__(
@@ -101,6 +108,7 @@ class RollingAutoencoder(RollingDeepEstimator, anomaly.base.AnomalyDetector):
             seed=seed,
             window_size=window_size,
             append_predict=append_predict,
+            jit=jit,
             **kwargs,
         )
 
@@ -144,7 +152,8 @@ class RollingAutoencoder(RollingDeepEstimator, anomaly.base.AnomalyDetector):
         }
 
     def _learn(self, x: torch.Tensor):
-        self.module.train()
+        if not self.module.training:
+            self.module.train()
         x_pred = self.module(x)
         loss = self.loss_fn(x_pred, x)
 
@@ -216,8 +225,9 @@ class RollingAutoencoder(RollingDeepEstimator, anomaly.base.AnomalyDetector):
             x_win = self._x_window.copy()
             x_win.append(list(x.values()))
             x_t = deque2rolling_tensor(x_win, device=self.device)
-            self.module.eval()
-            with torch.inference_mode():
+            if self.module.training:
+                self.module.eval()
+            with self._no_grad():
                 x_pred = self.module(x_t)
             loss = self.loss_fn(x_pred, x_t)
             res = loss.item()
@@ -238,8 +248,9 @@ class RollingAutoencoder(RollingDeepEstimator, anomaly.base.AnomalyDetector):
 
         if len(self._x_window) == self.window_size:
             X_t = deque2rolling_tensor(x_win, device=self.device)
-            self.module.eval()
-            with torch.inference_mode():
+            if self.module.training:
+                self.module.eval()
+            with self._no_grad():
                 x_pred = self.module(X_t)
             loss = torch.mean(
                 self.loss_fn(x_pred, x_pred, reduction="none"),
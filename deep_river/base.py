@@ -1,12 +1,13 @@
 import abc
 import collections
 import inspect
-from typing import Any, Callable, Deque, Optional, Type, Union, cast
+import warnings
+from typing import Any, Callable, Deque, Dict, Optional, Type, Union, cast
 
 import torch
 from river import base
 
-from deep_river.utils import get_loss_fn, get_optim_fn
+from deep_river.utils import dict2tensor, get_loss_fn, get_optim_fn
 
 try:
     from graphviz import Digraph
@@ -44,6 +45,12 @@ class DeepEstimator(base.Estimator):
         Device to run the wrapped model on. Can be "cpu" or "cuda".
     seed
         Random seed to be used for training the wrapped model.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
     **kwargs
         Parameters to be passed to the `Module` or the `optimizer`.
     """
@@ -56,6 +63,7 @@ class DeepEstimator(base.Estimator):
         lr: float = 1e-3,
         device: str = "cpu",
         seed: int = 42,
+        jit: bool = False,
         **kwargs,
     ):
         super().__init__()
@@ -67,7 +75,11 @@ class DeepEstimator(base.Estimator):
         self.device = device
         self.kwargs = kwargs
         self.seed = seed
+        self.jit = jit
         self.module_initialized = False
+        self._eager_module: torch.nn.Module = cast(torch.nn.Module, None)
+        self._input_buffers: Dict[int, torch.Tensor] = {}
+        self._script_failed = False
         torch.manual_seed(seed)
 
     @abc.abstractmethod
@@ -116,6 +128,31 @@ class DeepEstimator(base.Estimator):
         res.update(override)
         return res
 
+    def _dict2tensor(self, x: dict) -> torch.Tensor:
+        """Converts an input example to a tensor on `self.device`.
+
+        On non-CPU devices, the example is copied into a device buffer that
+        is allocated once per number of features and reused afterwards,
+        which avoids a device allocation for every example.
+
+        Parameters
+        ----------
+        x
+            Input example.
+
+        Returns
+        -------
+        torch.Tensor
+            Tensor of shape `(1, len(x))`.
+        """
+        if self.device == "cpu":
+            return dict2tensor(x, device=self.device)
+        buffer = self._input_buffers.get(len(x))
+        if buffer is None:
+            buffer = torch.empty((1, len(x)), device=self.device)
+            self._input_buffers[len(x)] = buffer
+        return dict2tensor(x, buffer=buffer)
+
     def draw(self) -> Digraph:
         """Draws the wrapped model."""
         first_parameter = next(self.module.parameters())
@@ -146,11 +183,57 @@ class DeepEstimator(base.Estimator):
             )
 
         self.module.to(self.device)
+        self._eager_module = self.module
+        if self.jit:
+            self._compile_module()
         self.optimizer = self.optimizer_fn(
             self.module.parameters(), lr=self.lr
         )
         self.module_initialized = True
 
+    def _compile_module(self):
+        """Compiles the eager module and uses the result as `self.module`.
+        The compiled module shares its parameters with the eager one, which
+        is kept for inspecting and altering the model's structure and has
+        to be compiled again after such alterations."""
+        if self._use_torch_compile():
+            # Online learning feeds inputs of a fixed shape, which lets the
+            # "reduce-overhead" mode replay the fused kernels as CUDA graphs.
+            self.module = torch.compile(
+                self._eager_module, mode="reduce-overhead", dynamic=False
+            )
+            return
+        # Altering the model does not make it scriptable, so scripting is
+        # not attempted again after it failed once.
+        if self._script_failed:
+            return
+        try:
+            self.module = torch.jit.script(self._eager_module)
+        except Exception as e:
+            warnings.warn(
+                "The model could not be compiled with TorchScript and will "
+                f"run in eager mode instead: {e}"
+            )
+            self._script_failed = True
+            self.module = self._eager_module
+
+    def _use_torch_compile(self) -> bool:
+        return (
+            self.jit
+            and hasattr(torch, "compile")
+            and self.device.startswith("cuda")
+            and torch.cuda.is_available()
+        )
+
+    def _no_grad(self) -> Union[torch.no_grad, torch.inference_mode]:
+        """Returns a context manager for running the module without
+        tracking gradients. Compiled modules record profiling information
+        on their first runs that must not contain inference tensors, so
+        they run under `torch.no_grad` instead of `torch.inference_mode`."""
+        if self.module is not self._eager_module:
+            return torch.no_grad()
+        return torch.inference_mode()
+
     def clone(self, new_params: dict = {}, include_attributes=False):
         """Clones the estimator.
 
@@ -211,6 +294,12 @@ class RollingDeepEstimator(DeepEstimator):
         Size of the rolling window used for storing previous examples.
     append_predict
         Whether to append inputs passed for prediction to the rolling window.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
     **kwargs
         Parameters to be passed to the `Module` or the `optimizer`.
     """
@@ -225,6 +314,7 @@ class RollingDeepEstimator(DeepEstimator):
         seed: int = 42,
         window_size: int = 10,
         append_predict: bool = False,
+        jit: bool = False,
         **kwargs,
     ):
         super().__init__(
@@ -234,6 +324,7 @@ class RollingDeepEstimator(DeepEstimator):
             lr=lr,
             device=device,
             seed=seed,
+            jit=jit,
             **kwargs,
         )
 
@@ -1,9 +1,21 @@
 import math
 import warnings
-from typing import Callable, Dict, List, Type, Union, cast
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import pandas as pd
 import torch
+import torch.nn.functional as F
 from ordered_set import OrderedSet
 from river import base
 from river.base.typing import ClfTarget
@@ -12,7 +24,9 @@ from torch.utils.hooks import RemovableHandle
 
 from deep_river.base import DeepEstimator
 from deep_river.utils.hooks import ForwardOrderTracker, apply_hooks
+from deep_river.utils.prefetch import prefetch
 from deep_river.utils.tensor_conversion import (
+    _to_device,
     df2tensor,
     dict2tensor,
     labels2onehot,
@@ -26,13 +40,10 @@ class _TestModule(torch.nn.Module):
         self.dense0 = torch.nn.Linear(n_features, 5)
         self.nonlin = torch.nn.ReLU()
         self.dense1 = torch.nn.Linear(5, 2)
-        self.softmax = torch.nn.Softmax(dim=-1)
 
-    def forward(self, X, **kwargs):
+    def forward(self, X):
         X = self.nonlin(self.dense0(X))
-        X = self.nonlin(self.dense1(X))
-        X = self.softmax(X)
-        return X
+        return self.dense1(X)
 
 
 class Classifier(DeepEstimator, base.MiniBatchClassifier):
@@ -63,7 +74,11 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
         Learning rate of the optimizer.
     output_is_logit
         Whether the module produces logits as output. If true, either
-        softmax or sigmoid is applied to the outputs when predicting.
+        softmax or sigmoid is applied to the outputs when predicting. In
+        that case `binary_cross_entropy` is computed on the logits via the
+        numerically stable `binary_cross_entropy_with_logits` and a warning
+        is raised, so modules that apply an output activation themselves
+        have to set this to False.
     is_class_incremental
         Whether the classifier should adapt to the appearance of
         previously unobserved classes by adding an unit to the output
@@ -71,11 +86,34 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
         layer is an nn.Linear layer. Note also, that output activation
         functions can not be adapted, meaning that a binary classifier
         with a sigmoid output can not be altered to perform multi-class
-        predictions.
+        predictions. If the module outputs logits, the output layer is
+        grown at least by its current size, and units of classes that have
+        not been observed yet are ignored.
     device
         Device to run the wrapped model on. Can be "cpu" or "cuda".
     seed
         Random seed to be used for training the wrapped model.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
+    cuda_graph
+        Whether to capture the training step in a CUDA graph once the input
+        shape and the number of classes stop changing and to replay it
+        afterwards, which reduces kernel launch overhead. Requires a forward
+        pass without data-dependent control flow. Only used on CUDA devices.
+    accumulation_steps
+        Number of examples that `learn_one` collects before training on all
+        of them at once as a mini-batch. Values above 1 trade the recency of
+        updates for considerably fewer, larger training steps. Examples
+        that are still collected at the end of a stream are only trained
+        on by calling `learn_pending`.
+    mixed_precision
+        Whether to run the wrapped model in mixed precision on CUDA devices.
+        Uses bfloat16 on GPUs that support it efficiently and float16 with
+        loss scaling otherwise. Has no effect on other devices.
     **kwargs
         Parameters to be passed to the `build_fn` function aside from
         `n_features`.
@@ -95,18 +133,15 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
     ...         self.dense0 = nn.Linear(n_features,5)
     ...         self.nonlin = nn.ReLU()
     ...         self.dense1 = nn.Linear(5, 2)
-    ...         self.softmax = nn.Softmax(dim=-1)
     ...
-    ...     def forward(self, X, **kwargs):
+    ...     def forward(self, X):
     ...         X = self.nonlin(self.dense0(X))
-    ...         X = self.nonlin(self.dense1(X))
-    ...         X = self.softmax(X)
-    ...         return X
+    ...         return self.dense1(X)
 
     >>> model_pipeline = compose.Pipeline(
     ...     preprocessing.StandardScaler,
     ...     Classifier(module=MyModule,
-    ...                loss_fn="binary_cross_entropy",
+    ...                loss_fn="binary_cross_entropy_with_logits",
     ...                optimizer_fn='adam')
     ... )
 
@@ -120,9 +155,11 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
     ...     model_pipeline = model_pipeline.learn_one(x,y)
 
     >>> print(f'Accuracy: {metric.get()}')
-    Accuracy: 0.6728
+    Accuracy: 0.8368
     """
 
+    _GRAPH_WARMUP_STEPS = 10
+
     def __init__(
         self,
         module: Type[torch.nn.Module],
@@ -133,6 +170,10 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
         is_class_incremental: bool = False,
         device: str = "cpu",
         seed: int = 42,
+        jit: bool = False,
+        cuda_graph: bool = False,
+        accumulation_steps: int = 1,
+        mixed_precision: bool = False,
         **kwargs,
     ):
         super().__init__(
@@ -142,13 +183,56 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
             device=device,
             lr=lr,
             seed=seed,
+            jit=jit,
             **kwargs,
         )
         self.observed_classes: OrderedSet[ClfTarget] = OrderedSet()
         self.output_layer: nn.Module
         self.output_is_logit = output_is_logit
         self.is_class_incremental = is_class_incremental
+        self.cuda_graph = cuda_graph
+        self.accumulation_steps = accumulation_steps
+        self.mixed_precision = mixed_precision
+        self._x_pending: List[torch.Tensor] = []
+        self._y_pending: List[ClfTarget] = []
+        self._onehot_cache: Dict[ClfTarget, torch.Tensor] = {}
+        self._onehot_n_classes = 0
+        self._n_outputs: Optional[int] = None
         self._supported_output_layers: List[Type[nn.Module]] = [nn.Linear]
+        self._amp_dtype: Optional[torch.dtype] = None
+        if (
+            mixed_precision
+            and self.device.startswith("cuda")
+            and torch.cuda.is_available()
+        ):
+            # bfloat16 has the exponent range of float32 and therefore does
+            # not need loss scaling, but is only fast on Ampere or newer.
+            if torch.cuda.get_device_capability(self.device)[0] >= 8:
+                self._amp_dtype = torch.bfloat16
+            else:
+                self._amp_dtype = torch.float16
+        self._scaler: Optional[torch.cuda.amp.GradScaler] = None
+        if self._amp_dtype == torch.float16:
+            self._scaler = torch.cuda.amp.GradScaler()
+        # Fuse the output activation into the loss where possible, which is
+        # both cheaper and more stable than normalizing inside the model.
+        self._loss_fn = self.loss_fn
+        if output_is_logit and self.loss_fn is F.binary_cross_entropy:
+            warnings.warn(
+                "The module is expected to output logits, so "
+                "binary_cross_entropy is computed via "
+                "binary_cross_entropy_with_logits. Set output_is_logit=False "
+                "if the module already applies an output activation."
+            )
+            self._loss_fn = F.binary_cross_entropy_with_logits
+        self._inference_module: Optional[nn.Module] = None
+        self._quantization_interval: Optional[int] = None
+        self._n_steps_since_quantization = 0
+        self._graph: Optional[torch.cuda.CUDAGraph] = None
+        self._graph_shapes: Optional[Tuple[torch.Size, int]] = None
+        self._n_static_steps = 0
+        self._static_x: Optional[torch.Tensor] = None
+        self._static_y: Optional[torch.Tensor] = None
 
     @classmethod
     def _unit_test_params(cls):
@@ -189,22 +273,189 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
             "check_predict_proba_one_binary",
         }
 
-    def _learn(self, x: torch.Tensor, y: Union[ClfTarget, List[ClfTarget]]):
-        self.module.train()
-        self.optimizer.zero_grad()
-        y_pred = self.module(x)
+    def _learn(
+        self, x: torch.Tensor, y: Union[ClfTarget, List[ClfTarget]]
+    ) -> "Classifier":
+        if not self.module.training:
+            self.module.train()
+        self._n_steps_since_quantization += 1
+        if (
+            self._graph is not None
+            and x.shape == cast(torch.Tensor, self._static_x).shape
+        ):
+            return self._replay_learn(x, y)
+
+        # A captured graph writes its gradients into the existing gradient
+        # tensors, so they must be zeroed in place instead of being freed.
+        self.optimizer.zero_grad(set_to_none=self._graph is None)
+        with self._autocast():
+            y_pred = self._select_outputs(self.module(x))
         n_classes = y_pred.shape[-1]
-        y = labels2onehot(
-            y=y,
-            classes=self.observed_classes,
-            n_classes=n_classes,
-            device=self.device,
+        y = self._encode_targets(y, n_classes=n_classes)
+        # Losses like binary_cross_entropy are unsafe to compute in half
+        # precision, so the loss is always computed in full precision.
+        loss = self._loss_fn(y_pred.float(), y)
+        if self._scaler is None:
+            loss.backward()
+            self.optimizer.step()
+        else:
+            self._scaler.scale(loss).backward()
+            self._scaler.step(self.optimizer)
+            self._scaler.update()
+
+        if self._can_use_cuda_graph():
+            shapes = (x.shape, n_classes)
+            if shapes == self._graph_shapes:
+                self._n_static_steps += 1
+            else:
+                self._graph_shapes = shapes
+                self._n_static_steps = 1
+            if self._n_static_steps >= self._GRAPH_WARMUP_STEPS:
+                self._capture_learn(x, y)
+        return self
+
+    def _encode_targets(
+        self, y: Union[ClfTarget, List[ClfTarget]], n_classes: int
+    ) -> torch.Tensor:
+        """
+        Encodes labels as targets for the loss function. Cross entropy on
+        more than one output is computed from class indices, which avoids
+        materializing one-hot targets. Labels without an output unit are
+        ignored in that case. All other losses receive one-hot targets,
+        which are cached for single labels.
+
+        Parameters
+        ----------
+        y
+            Label or list of labels.
+        n_classes
+            Number of output units of the wrapped model.
+
+        Returns
+        -------
+        torch.Tensor
+            Tensor of class indices or one-hot encoded targets.
+        """
+        if self._loss_fn is F.cross_entropy and n_classes > 1:
+            labels = list(y) if isinstance(y, (list, pd.Series)) else [y]
+            indices = torch.tensor(
+                [self.observed_classes.map[label] for label in labels]
+            )
+            indices[indices >= n_classes] = -100  # default ignore_index
+            return indices.to(self.device)
+        if isinstance(y, (list, pd.Series)):
+            return labels2onehot(
+                y=y,
+                classes=self.observed_classes,
+                n_classes=n_classes,
+                device=self.device,
+            )
+
+        # Class indices never change once assigned, so the encoding of a
+        # single label only becomes stale if the number of outputs changes.
+        # Cached targets are never modified in place and can be shared.
+        if n_classes != self._onehot_n_classes:
+            self._onehot_cache.clear()
+            self._onehot_n_classes = n_classes
+        onehot = self._onehot_cache.get(y)
+        if onehot is None:
+            onehot = labels2onehot(
+                y=y,
+                classes=self.observed_classes,
+                n_classes=n_classes,
+                device=self.device,
+            )
+            self._onehot_cache[y] = onehot
+        return onehot
+
+    def _can_use_cuda_graph(self) -> bool:
+        # Loss scaling relies on host synchronizations that can not be
+        # captured, so graphs are only used without a gradient scaler.
+        # Modules compiled by torch.compile already replay their own graphs.
+        return (
+            self.cuda_graph
+            and self.device.startswith("cuda")
+            and torch.cuda.is_available()
+            and self._scaler is None
+            and not self._use_torch_compile()
         )
-        loss = self.loss_fn(y_pred, y)
-        loss.backward()
+
+    def _capture_learn(self, x: torch.Tensor, y: torch.Tensor):
+        """
+        Captures the forward and backward pass of a training step in a CUDA
+        graph. The optimizer step is not captured, since most optimizers
+        keep state that is not safe to update within a graph.
+
+        Parameters
+        ----------
+        x
+            Input tensor of the shape used for all captured steps.
+        y
+            Encoded target tensor.
+        """
+        self._static_x = x.clone()
+        self._static_y = y.clone()
+
+        # Warm up on a side stream as required for capturing, without
+        # updating the parameters.
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(3):
+                self.optimizer.zero_grad(set_to_none=True)
+                with self._autocast(cache_enabled=False):
+                    y_pred = self._select_outputs(self.module(self._static_x))
+                self._loss_fn(y_pred.float(), self._static_y).backward()
+        torch.cuda.current_stream().wait_stream(stream)
+
+        self.optimizer.zero_grad(set_to_none=True)
+        self._graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(self._graph):
+            with self._autocast(cache_enabled=False):
+                y_pred = self._select_outputs(self.module(self._static_x))
+            self._loss_fn(y_pred.float(), self._static_y).backward()
+
+    def _replay_learn(
+        self, x: torch.Tensor, y: Union[ClfTarget, List[ClfTarget]]
+    ) -> "Classifier":
+        _, n_classes = cast(Tuple[torch.Size, int], self._graph_shapes)
+        cast(torch.Tensor, self._static_x).copy_(x)
+        cast(torch.Tensor, self._static_y).copy_(
+            self._encode_targets(y, n_classes=n_classes)
+        )
+        # The replayed backward pass overwrites the gradients held by the
+        # graph, so they must not be zeroed or set to None in between.
+        cast(torch.cuda.CUDAGraph, self._graph).replay()
         self.optimizer.step()
         return self
 
+    def _reset_cuda_graph(self) -> None:
+        self._graph = None
+        self._graph_shapes = None
+        self._n_static_steps = 0
+        self._static_x = None
+        self._static_y = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # CUDA graphs can neither be copied nor pickled, so the copy
+        # captures its own graph once it is trained further.
+        for key in ("_graph", "_graph_shapes", "_static_x", "_static_y"):
+            state[key] = None
+        state["_n_static_steps"] = 0
+        return state
+
+    def _autocast(self, cache_enabled: bool = True) -> torch.autocast:
+        """Returns a context manager that runs the enclosed operations in
+        mixed precision if it is enabled for a CUDA device and is a no-op
+        otherwise."""
+        return torch.autocast(
+            device_type="cuda",
+            dtype=self._amp_dtype or torch.float16,
+            enabled=self._amp_dtype is not None,
+            cache_enabled=cache_enabled,
+        )
+
     def learn_one(self, x: dict, y: ClfTarget, **kwargs) -> "Classifier":
         """
         Performs one step of training with a single example.
@@ -226,14 +477,40 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
         if not self.module_initialized:
             self.kwargs["n_features"] = len(x)
             self.initialize_module(**self.kwargs)
-        x_t = dict2tensor(x, device=self.device)
 
         # check last layer
-        self.observed_classes.add(y)
-        if self.is_class_incremental:
-            self._adapt_output_dim()
+        if y not in self.observed_classes:
+            self.observed_classes.add(y)
+            if self.is_class_incremental:
+                self._adapt_output_dim()
+
+        if self.accumulation_steps > 1:
+            self._x_pending.append(dict2tensor(x))
+            self._y_pending.append(y)
+            if len(self._x_pending) < self.accumulation_steps:
+                return self
+            return self.learn_pending()
+
+        return self._learn(x=self._dict2tensor(x), y=y)
 
-        return self._learn(x=x_t, y=y)
+    def learn_pending(self) -> "Classifier":
+        """
+        Performs one step of training with the examples that `learn_one`
+        collected since the last step, even if there are fewer than
+        `accumulation_steps` of them. Does nothing if no examples are
+        pending.
+
+        Returns
+        -------
+        Classifier
+            The classifier itself.
+        """
+        if not self._x_pending:
+            return self
+        x_t = _to_device(torch.cat(self._x_pending), self.device)
+        y_batch = self._y_pending
+        self._x_pending, self._y_pending = [], []
+        return self._learn(x=x_t, y=y_batch)
 
     def predict_proba_one(self, x: dict) -> Dict[ClfTarget, float]:
         """
@@ -252,10 +529,11 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
         if not self.module_initialized:
             self.kwargs["n_features"] = len(x)
             self.initialize_module(**self.kwargs)
-        x_t = dict2tensor(x, device=self.device)
-        self.module.eval()
-        with torch.inference_mode():
-            y_pred = self.module(x_t)
+        x_t = self._dict2tensor(x)
+        if self.module.training:
+            self.module.eval()
+        with self._no_grad(), self._autocast():
+            y_pred = self._select_outputs(self._predict_module()(x_t)).float()
         return output2proba(
             y_pred, self.observed_classes, self.output_is_logit
         )[0]
@@ -276,14 +554,20 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
         Classifier
             The classifier itself.
         """
+        return self._learn_many(self._batch2tensor(X), y)
+
+    def _learn_many(self, X: torch.Tensor, y: pd.Series) -> "Classifier":
         # check if model is initialized
         if not self.module_initialized:
-            self.kwargs["n_features"] = len(X.columns)
+            self.kwargs["n_features"] = X.shape[-1]
             self.initialize_module(**self.kwargs)
-        X = df2tensor(X, device=self.device)
 
-        self.observed_classes.update(y)
-        if self.is_class_incremental:
+        n_observed_classes = len(self.observed_classes)
+        self.observed_classes.update(y.unique().tolist())
+        if (
+            self.is_class_incremental
+            and len(self.observed_classes) > n_observed_classes
+        ):
             self._adapt_output_dim()
 
         return self._learn(x=X, y=y)
@@ -302,23 +586,165 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
         pd.DataFrame
             DataFrame of probabilities for each label.
         """
+        return self._predict_proba_many(self._batch2tensor(X))
+
+    def _predict_proba_many(self, X_t: torch.Tensor) -> pd.DataFrame:
         if not self.module_initialized:
-            self.kwargs["n_features"] = len(X.columns)
+            self.kwargs["n_features"] = X_t.shape[-1]
             self.initialize_module(**self.kwargs)
-        X_t = df2tensor(X, device=self.device)
-        self.module.eval()
-        with torch.inference_mode():
-            y_preds = self.module(X_t)
-        return pd.DataFrame(output2proba(y_preds, self.observed_classes))
+        if self.module.training:
+            self.module.eval()
+        with self._no_grad(), self._autocast():
+            y_preds = self._select_outputs(self._predict_module()(X_t)).float()
+        return pd.DataFrame(
+            output2proba(y_preds, self.observed_classes, self.output_is_logit)
+        )
+
+    def learn_iter(
+        self, batches: Iterable[Tuple[pd.DataFrame, pd.Series]]
+    ) -> "Classifier":
+        """
+        Performs one step of training for each batch of examples, while
+        the next batch is converted to a tensor in a background thread.
+
+        Parameters
+        ----------
+        batches
+            Iterable of input examples and their target values.
+
+        Returns
+        -------
+        Classifier
+            The classifier itself.
+        """
+        for X_t, y in prefetch(
+            batches, lambda batch: (self._batch2tensor(batch[0]), batch[1])
+        ):
+            self._learn_many(X_t, y)
+        return self
+
+    def predict_proba_iter(
+        self, batches: Iterable[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Predict the probability of each label for each batch of input
+        examples, while the next batch is converted to a tensor in a
+        background thread.
+
+        Parameters
+        ----------
+        batches
+            Iterable of input examples.
+
+        Yields
+        -------
+        pd.DataFrame
+            DataFrame of probabilities for each label of a batch.
+        """
+        for X_t in prefetch(batches, self._batch2tensor):
+            yield self._predict_proba_many(X_t)
+
+    def _batch2tensor(self, X: pd.DataFrame) -> torch.Tensor:
+        return df2tensor(X, device=self.device)
+
+    def quantize_for_inference(
+        self, refresh_interval: int = 100
+    ) -> "Classifier":
+        """
+        Makes predictions use a copy of the model whose linear layers are
+        dynamically quantized to int8, which speeds up inference on CPU at
+        the cost of slightly less accurate probabilities. Training keeps
+        updating the full precision model, from which the quantized copy
+        is refreshed.
+
+        Parameters
+        ----------
+        refresh_interval
+            Number of training steps after which the quantized copy is
+            considered outdated and recreated on the next prediction.
+
+        Returns
+        -------
+        Classifier
+            The classifier itself.
+        """
+        if not self.device.startswith("cpu"):
+            raise ValueError(
+                "Dynamic quantization is only supported on CPU devices."
+            )
+        self._quantization_interval = refresh_interval
+        self._inference_module = None
+        return self
+
+    def _predict_module(self) -> nn.Module:
+        if self._quantization_interval is None:
+            return self.module
+        if (
+            self._inference_module is None
+            or self._n_steps_since_quantization >= self._quantization_interval
+        ):
+            self._inference_module = torch.ao.quantization.quantize_dynamic(
+                self._eager_module, {nn.Linear}, dtype=torch.qint8
+            ).eval()
+            self._n_steps_since_quantization = 0
+        return self._inference_module
 
     def _adapt_output_dim(self):
-        out_features_target = (
-            len(self.observed_classes) if len(self.observed_classes) > 2 else 1
+        n_classes_to_add = self._n_classes_to_add(
+            self.output_layer.out_features
         )
-        n_classes_to_add = out_features_target - self.output_layer.out_features
         if n_classes_to_add > 0:
             self._add_output_features(n_classes_to_add)
 
+    def _n_classes_to_add(
+        self, out_features: int, reserve: bool = True
+    ) -> int:
+        """
+        Marks an output unit for each observed class as used and returns the
+        number of units to add to an output layer with `out_features` units
+        to provide them.
+
+        Parameters
+        ----------
+        out_features
+            Current number of units of the output layer.
+        reserve
+            Whether the layer may be grown beyond the number of observed
+            classes to reserve units for future classes.
+
+        Returns
+        -------
+        int
+            Number of units to add.
+        """
+        out_features_target = (
+            len(self.observed_classes) if len(self.observed_classes) > 2 else 1
+        )
+        n_outputs = (
+            out_features if self._n_outputs is None else self._n_outputs
+        )
+        if out_features_target <= n_outputs:
+            return 0
+        self._n_outputs = out_features_target
+        self._reset_cuda_graph()
+        n_classes_to_add = max(out_features_target - out_features, 0)
+        # Grow the layer at least by its current size, so that a stream
+        # with many classes only needs a logarithmic number of resizes.
+        # Reserved units would take probability mass from an output
+        # activation inside the model, so only logits are over-allocated.
+        if n_classes_to_add > 0 and reserve and self.output_is_logit:
+            n_classes_to_add = max(out_features, n_classes_to_add)
+        return n_classes_to_add
+
+    def _select_outputs(self, y_pred: torch.Tensor) -> torch.Tensor:
+        """
+        Drops the output units that are reserved for classes that have not
+        been observed yet.
+        """
+        if self._n_outputs is None:
+            return y_pred
+        return y_pred[..., : self._n_outputs]
+
     def _add_output_features(self, n_classes_to_add: int) -> None:
         """
         Adds output dimensions to the model by adding new rows of weights to
@@ -329,17 +755,9 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
         n_classes_to_add
             Number of output dimensions to add.
         """
-        new_weights = (
-            torch.mean(cast(torch.Tensor, self.output_layer.weight), dim=0)
-            .unsqueeze(1)
-            .T
-        )
-        if n_classes_to_add > 1:
-            new_weights = (
-                new_weights.unsqueeze(1)
-                .T.repeat(1, n_classes_to_add, 1)
-                .squeeze()
-            )
+        new_weights = torch.mean(
+            cast(torch.Tensor, self.output_layer.weight), dim=0, keepdim=True
+        ).repeat(n_classes_to_add, 1)
         self.output_layer.weight = nn.parameter.Parameter(
             torch.cat(
                 [
@@ -366,7 +784,11 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
                     dim=0,
                 )
             )
-        self.output_layer.out_features += torch.Tensor([n_classes_to_add])
+        self.output_layer.out_features += n_classes_to_add
+        if self.jit:
+            self._compile_module()
+        self._reset_cuda_graph()
+        self._inference_module = None
         self.optimizer = self.optimizer_fn(
             self.module.parameters(), lr=self.lr
         )
@@ -374,10 +796,10 @@ class Classifier(DeepEstimator, base.MiniBatchClassifier):
     def find_output_layer(self, n_features: int):
         handles: List[RemovableHandle] = []
         tracker = ForwardOrderTracker()
-        apply_hooks(module=self.module, hook=tracker, handles=handles)
+        apply_hooks(module=self._eager_module, hook=tracker, handles=handles)
 
         x_dummy = torch.empty((1, n_features), device=self.device)
-        self.module(x_dummy)
+        self._eager_module(x_dummy)
 
         for h in handles:
             h.remove()
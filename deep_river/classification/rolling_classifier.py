@@ -1,5 +1,5 @@
 import math
-from typing import Callable, Dict, List, Type, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Type, Union
 
 import pandas as pd
 import torch
@@ -22,13 +22,11 @@ class _TestLSTM(torch.nn.Module):
         self.lstm = torch.nn.LSTM(
             input_size=n_features, hidden_size=hidden_size, num_layers=1
         )
-        self.softmax = torch.nn.Softmax(dim=-1)
 
-    def forward(self, X, **kwargs):
+    def forward(self, X):
         # lstm with input, hidden, and internal state
         output, (hn, cn) = self.lstm(X)
-        hn = hn.view(-1, self.hidden_size)
-        return self.softmax(hn)
+        return hn.view(-1, self.hidden_size)
 
 
 class RollingClassifier(Classifier, RollingDeepEstimator):
@@ -57,8 +55,12 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
     lr
         Learning rate of the optimizer.
     output_is_logit
-            Whether the module produces logits as output. If true, either
-            softmax or sigmoid is applied to the outputs when predicting.
+        Whether the module produces logits as output. If true, either
+        softmax or sigmoid is applied to the outputs when predicting. In
+        that case `binary_cross_entropy` is computed on the logits via the
+        numerically stable `binary_cross_entropy_with_logits` and a warning
+        is raised, so modules that apply an output activation themselves
+        have to set this to False.
     is_class_incremental
         Whether the classifier should adapt to the appearance of previously
         unobserved classes by adding an unit to the output
@@ -66,6 +68,9 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
         is an nn.Linear layer. Note also, that output activation functions
         can not be adapted, meaning that a binary classifier with a sigmoid
         output can not be altered to perform multi-class predictions.
+        If the module outputs logits, linear output layers are grown at
+        least by their current size, and units of classes that have not
+        been observed yet are ignored.
     device
         Device to run the wrapped model on. Can be "cpu" or "cuda".
     seed
@@ -74,6 +79,21 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
         Number of recent examples to be fed to the wrapped model at each step.
     append_predict
         Whether to append inputs passed for prediction to the rolling window.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
+    cuda_graph
+        Whether to capture the training step in a CUDA graph once the input
+        shape and the number of classes stop changing and to replay it
+        afterwards, which reduces kernel launch overhead. Requires a forward
+        pass without data-dependent control flow. Only used on CUDA devices.
+    mixed_precision
+        Whether to run the wrapped model in mixed precision on CUDA devices.
+        Uses bfloat16 on GPUs that support it efficiently and float16 with
+        loss scaling otherwise. Has no effect on other devices.
     **kwargs
         Parameters to be passed to the `build_fn`
         function aside from `n_features`.
@@ -97,7 +117,7 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
     ...                                  bias=False)
     ...        self.softmax = torch.nn.Softmax(dim=-1)
     ...
-    ...    def forward(self, X, **kwargs):
+    ...    def forward(self, X):
     ...        output, (hn, cn) = self.lstm(X)
     ...        hn = hn.view(-1, self.lstm.hidden_size)
     ...        return self.softmax(hn)
@@ -114,6 +134,7 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
     ...     window_size=20,
     ...     lr=1e-2,
     ...     append_predict=True,
+    ...     output_is_logit=False,
     ...     is_class_incremental=True
     ... )
 
@@ -128,7 +149,7 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
     def __init__(
         self,
         module: Type[torch.nn.Module],
-        loss_fn: Union[str, Callable] = "binary_cross_entropy",
+        loss_fn: Union[str, Callable] = "binary_cross_entropy_with_logits",
         optimizer_fn: Union[str, Callable] = "sgd",
         lr: float = 1e-3,
         output_is_logit: bool = True,
@@ -137,6 +158,9 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
         seed: int = 42,
         window_size: int = 10,
         append_predict: bool = False,
+        jit: bool = False,
+        cuda_graph: bool = False,
+        mixed_precision: bool = False,
         **kwargs,
     ):
         super().__init__(
@@ -150,6 +174,9 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
             seed=seed,
             window_size=window_size,
             append_predict=append_predict,
+            jit=jit,
+            cuda_graph=cuda_graph,
+            mixed_precision=mixed_precision,
             **kwargs,
         )
         self._supported_output_layers: List[Type[nn.Module]] = [
@@ -224,9 +251,10 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
         self._x_window.append(list(x.values()))
 
         # check last layer
-        self.observed_classes.add(y)
-        if self.is_class_incremental:
-            self._adapt_output_dim()
+        if y not in self.observed_classes:
+            self.observed_classes.add(y)
+            if self.is_class_incremental:
+                self._adapt_output_dim()
 
         # training process
         if len(self._x_window) == self.window_size:
@@ -254,13 +282,18 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
             self.initialize_module(**self.kwargs)
 
         if len(self._x_window) == self.window_size:
-            self.module.eval()
-            with torch.inference_mode():
+            if self.module.training:
+                self.module.eval()
+            with self._no_grad(), self._autocast():
                 x_win = self._x_window.copy()
                 x_win.append(list(x.values()))
                 x_t = deque2rolling_tensor(x_win, device=self.device)
-                y_pred = self.module(x_t)
-                proba = output2proba(y_pred, self.observed_classes)
+                y_pred = self._select_outputs(
+                    self._predict_module()(x_t)
+                ).float()
+                proba = output2proba(
+                    y_pred, self.observed_classes, self.output_is_logit
+                )
         else:
             proba = self._get_default_proba()
 
@@ -293,8 +326,12 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
 
         self._x_window.extend(X.values.tolist())
 
-        self.observed_classes.update(y)
-        if self.is_class_incremental:
+        n_observed_classes = len(self.observed_classes)
+        self.observed_classes.update(y.unique().tolist())
+        if (
+            self.is_class_incremental
+            and len(self.observed_classes) > n_observed_classes
+        ):
             self._adapt_output_dim()
 
         if len(self._x_window) == self.window_size:
@@ -323,18 +360,66 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
         x_win.extend(X.values.tolist())
 
         if len(x_win) == self.window_size:
-            self.module.eval()
-            with torch.inference_mode():
+            if self.module.training:
+                self.module.eval()
+            with self._no_grad(), self._autocast():
                 x_t = deque2rolling_tensor(x_win, device=self.device)
-                probas = self.module(x_t).detach().tolist()
+                y_preds = self._select_outputs(
+                    self._predict_module()(x_t)
+                ).float()
+                probas = output2proba(
+                    y_preds, self.observed_classes, self.output_is_logit
+                )
                 if len(probas) < len(X):
-                    default_proba = self._get_default_proba()
+                    default_proba = self._get_default_proba()[0]
                     probas = [default_proba] * (len(X) - len(probas)) + probas
         else:
-            default_proba = self._get_default_proba()
+            default_proba = self._get_default_proba()[0]
             probas = [default_proba] * len(X)
         return pd.DataFrame(probas)
 
+    def learn_iter(
+        self, batches: Iterable[Tuple[pd.DataFrame, pd.Series]]
+    ) -> "RollingClassifier":
+        """
+        Performs one step of training for each batch of examples. Since the
+        inputs depend on the sliding window, the batches are not prefetched.
+
+        Parameters
+        ----------
+        batches
+            Iterable of input examples and their target values.
+
+        Returns
+        -------
+        RollingClassifier
+            The classifier itself.
+        """
+        for X, y in batches:
+            self.learn_many(X, y)
+        return self
+
+    def predict_proba_iter(
+        self, batches: Iterable[pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Predict the probability of each label for each batch of input
+        examples. Since the inputs depend on the sliding window, the batches
+        are not prefetched.
+
+        Parameters
+        ----------
+        batches
+            Iterable of input examples.
+
+        Yields
+        -------
+        pd.DataFrame
+            DataFrame of probabilities for each label of a batch.
+        """
+        for X in batches:
+            yield self.predict_proba_many(X)
+
     def _get_default_proba(self) -> List[Dict[ClfTarget, float]]:
         if len(self.observed_classes) > 0:
             mean_proba = (
@@ -348,12 +433,10 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
         return [proba] if isinstance(proba, dict) else proba
 
     def _adapt_output_dim(self):
-        out_features_target = (
-            len(self.observed_classes) if len(self.observed_classes) > 2 else 1
-        )
+        n_classes_to_add = 0
         if isinstance(self.output_layer, nn.Linear):
-            n_classes_to_add = (
-                out_features_target - self.output_layer.out_features
+            n_classes_to_add = self._n_classes_to_add(
+                self.output_layer.out_features
             )
             if n_classes_to_add > 0:
                 mean_input_weights = torch.empty(
@@ -378,8 +461,10 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
                     )
                 self.output_layer.out_features += n_classes_to_add
         elif isinstance(self.output_layer, nn.LSTM):
-            n_classes_to_add = (
-                out_features_target - self.output_layer.hidden_size
+            # Recurrent units feed back into the layer, so they are only
+            # added for observed classes.
+            n_classes_to_add = self._n_classes_to_add(
+                self.output_layer.hidden_size, reserve=False
             )
             if n_classes_to_add > 0:
                 assert (
@@ -514,8 +599,8 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
                     )
                 self.output_layer.hidden_size += n_classes_to_add
         elif isinstance(self.output_layer, nn.RNN):
-            n_classes_to_add = (
-                out_features_target - self.output_layer.hidden_size
+            n_classes_to_add = self._n_classes_to_add(
+                self.output_layer.hidden_size, reserve=False
             )
             if n_classes_to_add > 0:
                 assert (
@@ -600,6 +685,11 @@ class RollingClassifier(Classifier, RollingDeepEstimator):
                     )
                 self.output_layer.hidden_size += n_classes_to_add
 
+        if n_classes_to_add > 0:
+            if self.jit:
+                self._compile_module()
+            self._reset_cuda_graph()
+            self._inference_module = None
         self.optimizer = self.optimizer_fn(
             self.module.parameters(), lr=self.lr
         )
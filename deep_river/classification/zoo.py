@@ -25,7 +25,10 @@ class LogisticRegression(Classifier):
         Learning rate of the optimizer.
     output_is_logit
         Whether the module produces logits as output. If true, either
-        softmax or sigmoid is applied to the outputs when predicting.
+        softmax or sigmoid is applied to the outputs when predicting. In
+        that case `binary_cross_entropy` is computed on the logits via the
+        numerically stable `binary_cross_entropy_with_logits` and a warning
+        is raised.
     is_class_incremental
         Whether the classifier should adapt to the appearance of
         previously unobserved classes by adding an unit to the output
@@ -33,11 +36,32 @@ class LogisticRegression(Classifier):
         layer is an nn.Linear layer. Note also, that output activation
         functions can not be adapted, meaning that a binary classifier
         with a sigmoid output can not be altered to perform multi-class
-        predictions.
+        predictions. If the module outputs logits, the output layer is
+        grown at least by its current size, and units of classes that have
+        not been observed yet are ignored.
     device
         Device to run the wrapped model on. Can be "cpu" or "cuda".
     seed
         Random seed to be used for training the wrapped model.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
+    cuda_graph
+        Whether to capture the training step in a CUDA graph once the input
+        shape and the number of classes stop changing and to replay it
+        afterwards, which reduces kernel launch overhead. Requires a forward
+        pass without data-dependent control flow. Only used on CUDA devices.
+    accumulation_steps
+        Number of examples that `learn_one` collects before training on all
+        of them at once as a mini-batch. Values above 1 trade the recency of
+        updates for considerably fewer, larger training steps.
+    mixed_precision
+        Whether to run the wrapped model in mixed precision on CUDA devices.
+        Uses bfloat16 on GPUs that support it efficiently and float16 with
+        loss scaling otherwise. Has no effect on other devices.
     **kwargs
         Parameters to be passed to the `build_fn` function aside from
         `n_features`.
@@ -64,7 +88,7 @@ class LogisticRegression(Classifier):
     ...     model_pipeline = model_pipeline.learn_one(x, y) # update the model
 
     >>> print(f"Accuracy: {metric.get():.2f}")
-    Accuracy: 0.44
+    Accuracy: 0.58
 
     """
 
@@ -72,11 +96,9 @@ class LogisticRegression(Classifier):
         def __init__(self, n_features):
             super().__init__()
             self.dense0 = nn.Linear(n_features, 1)
-            self.softmax = nn.Softmax(dim=-1)
 
-        def forward(self, X, **kwargs):
-            X = self.dense0(X)
-            return self.softmax(X)
+        def forward(self, X):
+            return self.dense0(X)
 
     def __init__(
         self,
@@ -87,6 +109,10 @@ class LogisticRegression(Classifier):
         is_class_incremental: bool = False,
         device: str = "cpu",
         seed: int = 42,
+        jit: bool = False,
+        cuda_graph: bool = False,
+        accumulation_steps: int = 1,
+        mixed_precision: bool = False,
         **kwargs,
     ):
         if "module" in kwargs:
@@ -100,6 +126,10 @@ class LogisticRegression(Classifier):
             device=device,
             lr=lr,
             seed=seed,
+            jit=jit,
+            cuda_graph=cuda_graph,
+            accumulation_steps=accumulation_steps,
+            mixed_precision=mixed_precision,
             **kwargs,
         )
 
@@ -146,7 +176,10 @@ class MultiLayerPerceptron(Classifier):
         Learning rate of the optimizer.
     output_is_logit
         Whether the module produces logits as output. If true, either
-        softmax or sigmoid is applied to the outputs when predicting.
+        softmax or sigmoid is applied to the outputs when predicting. In
+        that case `binary_cross_entropy` is computed on the logits via the
+        numerically stable `binary_cross_entropy_with_logits` and a warning
+        is raised.
     is_class_incremental
         Whether the classifier should adapt to the appearance of
         previously unobserved classes by adding an unit to the output
@@ -154,11 +187,32 @@ class MultiLayerPerceptron(Classifier):
         layer is an nn.Linear layer. Note also, that output activation
         functions can not be adapted, meaning that a binary classifier
         with a sigmoid output can not be altered to perform multi-class
-        predictions.
+        predictions. If the module outputs logits, the output layer is
+        grown at least by its current size, and units of classes that have
+        not been observed yet are ignored.
     device
         Device to run the wrapped model on. Can be "cpu" or "cuda".
     seed
         Random seed to be used for training the wrapped model.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
+    cuda_graph
+        Whether to capture the training step in a CUDA graph once the input
+        shape and the number of classes stop changing and to replay it
+        afterwards, which reduces kernel launch overhead. Requires a forward
+        pass without data-dependent control flow. Only used on CUDA devices.
+    accumulation_steps
+        Number of examples that `learn_one` collects before training on all
+        of them at once as a mini-batch. Values above 1 trade the recency of
+        updates for considerably fewer, larger training steps.
+    mixed_precision
+        Whether to run the wrapped model in mixed precision on CUDA devices.
+        Uses bfloat16 on GPUs that support it efficiently and float16 with
+        loss scaling otherwise. Has no effect on other devices.
     **kwargs
         Parameters to be passed to the `build_fn` function aside from
         `n_features`.
@@ -185,7 +239,7 @@ class MultiLayerPerceptron(Classifier):
     ...     model_pipeline = model_pipeline.learn_one(x, y) # update the model
 
     >>> print(f"Accuracy: {metric.get():.2f}")
-    Accuracy: 0.44
+    Accuracy: 0.56
 
     """
 
@@ -193,16 +247,16 @@ class MultiLayerPerceptron(Classifier):
         def __init__(self, n_width, n_layers, n_features):
             super().__init__()
             self.dense0 = nn.Linear(n_features, n_width)
-            self.block = [nn.Linear(n_width, n_width) for _ in range(n_layers)]
+            self.block = nn.ModuleList(
+                [nn.Linear(n_width, n_width) for _ in range(n_layers)]
+            )
             self.denselast = nn.Linear(n_width, 1)
-            self.softmax = nn.Softmax(dim=-1)
 
-        def forward(self, X, **kwargs):
+        def forward(self, X):
             X = self.dense0(X)
             for layer in self.block:
                 X = layer(X)
-            X = self.denselast(X)
-            return self.softmax(X)
+            return self.denselast(X)
 
     def __init__(
         self,
@@ -215,6 +269,10 @@ class MultiLayerPerceptron(Classifier):
         is_class_incremental: bool = False,
         device: str = "cpu",
         seed: int = 42,
+        jit: bool = False,
+        cuda_graph: bool = False,
+        accumulation_steps: int = 1,
+        mixed_precision: bool = False,
         **kwargs,
     ):
         self.n_width = n_width
@@ -232,6 +290,10 @@ class MultiLayerPerceptron(Classifier):
             seed=seed,
             n_width=n_width,
             n_layers=n_layers,
+            jit=jit,
+            cuda_graph=cuda_graph,
+            accumulation_steps=accumulation_steps,
+            mixed_precision=mixed_precision,
             **kwargs,
         )
 
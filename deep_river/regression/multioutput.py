@@ -7,7 +7,7 @@ from river.base import MultiTargetRegressor as RiverMultiTargetRegressor
 from river.base.typing import FeatureName, RegTarget
 
 from deep_river.regression import Regressor
-from deep_river.utils import dict2tensor, float2tensor
+from deep_river.utils import float2tensor
 
 
 class _TestModule(torch.nn.Module):
@@ -15,7 +15,7 @@ class _TestModule(torch.nn.Module):
         super().__init__()
         self.dense0 = torch.nn.Linear(n_features, n_outputs)
 
-    def forward(self, X, **kwargs):
+    def forward(self, X):
         return self.dense0(X)
 
 
@@ -44,6 +44,12 @@ class MultiTargetRegressor(RiverMultiTargetRegressor, Regressor):
         Device to run the wrapped model on. Can be "cpu" or "gpu".
     seed
         Random seed for the wrapped model.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
     **kwargs
         Parameters to be passed to the `Module` or the `optimizer`.
 
@@ -62,7 +68,7 @@ class MultiTargetRegressor(RiverMultiTargetRegressor, Regressor):
     ...         super(MyModule, self).__init__()
     ...         self.dense0 = nn.Linear(n_features,3)
     ...
-    ...     def forward(self, X, **kwargs):
+    ...     def forward(self, X):
     ...         X = self.dense0(X)
     ...         return X
 
@@ -94,6 +100,7 @@ class MultiTargetRegressor(RiverMultiTargetRegressor, Regressor):
         lr: float = 1e-3,
         device: str = "cpu",
         seed: int = 42,
+        jit: bool = False,
         **kwargs,
     ):
         super().__init__(
@@ -103,6 +110,7 @@ class MultiTargetRegressor(RiverMultiTargetRegressor, Regressor):
             optimizer_fn=optimizer_fn,
             lr=lr,
             seed=seed,
+            jit=jit,
             **kwargs,
         )
         self.observed_targets: OrderedDict[
@@ -159,7 +167,7 @@ class MultiTargetRegressor(RiverMultiTargetRegressor, Regressor):
         if not self.module_initialized:
             self.kwargs["n_features"] = len(x)
             self.initialize_module(**self.kwargs)
-        x_t = dict2tensor(x, self.device)
+        x_t = self._dict2tensor(x)
         self.observed_targets.update(y) if y is not None else None
         y_t = float2tensor(y, self.device)
         self._learn(x_t, y_t)
@@ -182,9 +190,10 @@ class MultiTargetRegressor(RiverMultiTargetRegressor, Regressor):
         if not self.module_initialized:
             self.kwargs["n_features"] = len(x)
             self.initialize_module(**self.kwargs)
-        x_t = dict2tensor(x, self.device)
-        self.module.eval()
-        with torch.inference_mode():
+        x_t = self._dict2tensor(x)
+        if self.module.training:
+            self.module.eval()
+        with self._no_grad():
             y_pred_t = self.module(x_t).squeeze().tolist()
             y_pred = {
                 t: y_pred_t[i] for i, t in enumerate(self.observed_targets)
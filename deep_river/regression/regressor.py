@@ -8,7 +8,6 @@ from river.base.typing import RegTarget
 from deep_river.base import DeepEstimator
 from deep_river.utils.tensor_conversion import (
     df2tensor,
-    dict2tensor,
     float2tensor,
 )
 
@@ -24,7 +23,7 @@ class _TestModule(torch.nn.Module):
         self.output = torch.nn.Linear(5, 1)
         self.softmax = torch.nn.Softmax(dim=-1)
 
-    def forward(self, X, **kwargs):
+    def forward(self, X):
         X = self.nonlin(self.dense0(X))
         X = self.dropout(X)
         X = self.nonlin(self.dense1(X))
@@ -59,6 +58,12 @@ class Regressor(DeepEstimator, base.MiniBatchRegressor):
         Device to run the wrapped model on. Can be "cpu" or "cuda".
     seed
         Random seed to be used for training the wrapped model.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
     **kwargs
         Parameters to be passed to the `Module` or the `optimizer`.
 
@@ -75,6 +80,7 @@ class Regressor(DeepEstimator, base.MiniBatchRegressor):
         lr: float = 1e-3,
         device: str = "cpu",
         seed: int = 42,
+        jit: bool = False,
         **kwargs,
     ):
         super().__init__(
@@ -84,6 +90,7 @@ class Regressor(DeepEstimator, base.MiniBatchRegressor):
             optimizer_fn=optimizer_fn,
             lr=lr,
             seed=seed,
+            jit=jit,
             **kwargs,
         )
 
@@ -145,13 +152,14 @@ class Regressor(DeepEstimator, base.MiniBatchRegressor):
         if not self.module_initialized:
             self.kwargs["n_features"] = len(x)
             self.initialize_module(**self.kwargs)
-        x_t = dict2tensor(x, self.device)
+        x_t = self._dict2tensor(x)
         y_t = float2tensor(y, device=self.device)
         self._learn(x_t, y_t)
         return self
 
     def _learn(self, x: torch.Tensor, y: torch.Tensor):
-        self.module.train()
+        if not self.module.training:
+            self.module.train()
         self.optimizer.zero_grad()
         y_pred = self.module(x)
         loss = self.loss_fn(y_pred, y)
@@ -175,9 +183,10 @@ class Regressor(DeepEstimator, base.MiniBatchRegressor):
         if not self.module_initialized:
             self.kwargs["n_features"] = len(x)
             self.initialize_module(**self.kwargs)
-        x_t = dict2tensor(x, self.device)
-        self.module.eval()
-        with torch.inference_mode():
+        x_t = self._dict2tensor(x)
+        if self.module.training:
+            self.module.eval()
+        with self._no_grad():
             y_pred = self.module(x_t).item()
         return y_pred
 
@@ -226,7 +235,8 @@ class Regressor(DeepEstimator, base.MiniBatchRegressor):
             self.initialize_module(**self.kwargs)
 
         X = df2tensor(X, device=self.device)
-        self.module.eval()
-        with torch.inference_mode():
+        if self.module.training:
+            self.module.eval()
+        with self._no_grad():
             y_preds = self.module(X).detach().squeeze().tolist()
         return y_preds
@@ -20,7 +20,7 @@ class _TestLSTM(torch.nn.Module):
             input_size=n_features, hidden_size=self.hidden_size, num_layers=1
         )
 
-    def forward(self, X, **kwargs):
+    def forward(self, X):
         # lstm with input, hidden, and internal state
         output, (hn, cn) = self.lstm(X)
         hn = hn.view(-1, self.hidden_size)
@@ -58,6 +58,12 @@ class RollingRegressor(RollingDeepEstimator, Regressor):
         Number of recent examples to be fed to the wrapped model at each step.
     append_predict
         Whether to append inputs passed for prediction to the rolling window.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
     **kwargs
         Parameters to be passed to the `Module` or the `optimizer`.
     """
@@ -72,6 +78,7 @@ class RollingRegressor(RollingDeepEstimator, Regressor):
         append_predict: bool = False,
         device: str = "cpu",
         seed: int = 42,
+        jit: bool = False,
         **kwargs,
     ):
         super().__init__(
@@ -83,6 +90,7 @@ class RollingRegressor(RollingDeepEstimator, Regressor):
             window_size=window_size,
             append_predict=append_predict,
             seed=seed,
+            jit=jit,
             **kwargs,
         )
 
@@ -192,8 +200,9 @@ class RollingRegressor(RollingDeepEstimator, Regressor):
             self.initialize_module(**self.kwargs)
 
         if len(self._x_window) == self.window_size:
-            self.module.eval()
-            with torch.inference_mode():
+            if self.module.training:
+                self.module.eval()
+            with self._no_grad():
                 x_win = self._x_window.copy()
                 x_win.append(list(x.values()))
                 x_t = deque2rolling_tensor(x_win, device=self.device)
@@ -213,8 +222,9 @@ class RollingRegressor(RollingDeepEstimator, Regressor):
         x_win = self._x_window.copy()
         x_win.extend(X.values.tolist())
         if len(x_win) == self.window_size:
-            self.module.eval()
-            with torch.inference_mode():
+            if self.module.training:
+                self.module.eval()
+            with self._no_grad():
                 x_t = deque2rolling_tensor(x_win, device=self.device)
                 res = self.module(x_t).detach().tolist()
 
@@ -16,7 +16,7 @@ class LinearRegression(Regressor):
             super().__init__()
             self.dense0 = nn.Linear(n_features, 1)
 
-        def forward(self, X, **kwargs):
+        def forward(self, X):
             X = self.dense0(X)
             return X
 
@@ -27,6 +27,7 @@ class LinearRegression(Regressor):
         lr: float = 1e-3,
         device: str = "cpu",
         seed: int = 42,
+        jit: bool = False,
         **kwargs,
     ):
         if "module" in kwargs:
@@ -38,6 +39,7 @@ class LinearRegression(Regressor):
             lr=lr,
             device=device,
             seed=seed,
+            jit=jit,
             **kwargs,
         )
 
@@ -97,6 +99,12 @@ class MultiLayerPerceptron(Regressor):
         Device to run the wrapped model on. Can be "cpu" or "cuda".
     seed
         Random seed to be used for training the wrapped model.
+    jit
+        Whether to compile the wrapped model once it is initialized, which
+        reduces the Python overhead of each forward pass. Uses
+        `torch.compile` on CUDA devices if PyTorch 2.0 or newer is
+        installed and TorchScript otherwise. Falls back to the eager model
+        if it can not be scripted.
     **kwargs
         Parameters to be passed to the `build_fn` function aside from
         `n_features`.
@@ -107,10 +115,12 @@ class MultiLayerPerceptron(Regressor):
         def __init__(self, n_width, n_layers, n_features):
             super().__init__()
             self.dense0 = nn.Linear(n_features, n_width)
-            self.block = [nn.Linear(n_width, n_width) for _ in range(n_layers)]
+            self.block = nn.ModuleList(
+                [nn.Linear(n_width, n_width) for _ in range(n_layers)]
+            )
             self.denselast = nn.Linear(n_width, 1)
 
-        def forward(self, X, **kwargs):
+        def forward(self, X):
             X = self.dense0(X)
             for layer in self.block:
                 X = layer(X)
@@ -125,6 +135,7 @@ class MultiLayerPerceptron(Regressor):
         lr: float = 1e-3,
         device: str = "cpu",
         seed: int = 42,
+        jit: bool = False,
         **kwargs,
     ):
         self.n_width = n_width
@@ -140,6 +151,7 @@ class MultiLayerPerceptron(Regressor):
             seed=seed,
             n_width=n_width,
             n_layers=n_layers,
+            jit=jit,
             **kwargs,
         )
 
@@ -1,6 +1,7 @@
 """Utility classes and functions."""
 from .estimator_checks import check_estimator
 from .params import get_activation_fn, get_init_fn, get_loss_fn, get_optim_fn
+from .prefetch import prefetch
 from .tensor_conversion import (
     deque2rolling_tensor,
     df2tensor,
@@ -22,4 +23,5 @@ __all__ = [
     "df2tensor",
     "float2tensor",
     "output2proba",
+    "prefetch",
 ]
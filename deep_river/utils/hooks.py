@@ -8,7 +8,10 @@ class ForwardOrderTracker:
         self.ordered_modules: List[nn.Module] = []
 
     def __call__(self, module, input, output):
-        if list(module.parameters()) and not list(module.children()):
+        # Only check for the first parameter and child instead of
+        # collecting all of them.
+        has_params = next(module.parameters(), None) is not None
+        if has_params and next(module.children(), None) is None:
             self.ordered_modules.append(module)
 
 
@@ -0,0 +1,74 @@
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def prefetch(
+    iterable: Iterable[T], fn: Callable[[T], R], size: int = 2
+) -> Iterator[R]:
+    """
+    Apply a function to the items of an iterable in a background thread,
+    so that preparing the next items overlaps with processing the current
+    one. Results are yielded in order and errors raised while preparing an
+    item are re-raised when it would have been yielded.
+
+    Parameters
+    ----------
+    iterable
+        Items to prepare.
+    fn
+        Function applied to each item.
+    size
+        Maximum number of prepared items waiting to be consumed.
+
+    Yields
+    -------
+    R
+        Result of `fn` for each item.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(obj) -> bool:
+        # Give up once the consumer stopped, instead of blocking forever on
+        # a full buffer that will never be drained.
+        while not stop.is_set():
+            try:
+                buffer.put(obj, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(fn(item)):
+                    return
+        except BaseException as e:
+            put(_Failure(e))
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            result = buffer.get()
+            if result is _DONE:
+                return
+            if isinstance(result, _Failure):
+                raise result.error
+            yield result
+    finally:
+        stop.set()
@@ -1,4 +1,5 @@
-from typing import Deque, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -8,8 +9,24 @@ from river import base
 from river.base.typing import ClfTarget, RegTarget
 
 
+@lru_cache(maxsize=None)
+def _numpy_dtype(dtype: torch.dtype) -> np.dtype:
+    return torch.empty(0, dtype=dtype).numpy().dtype
+
+
+def _to_device(tensor: torch.Tensor, device) -> torch.Tensor:
+    # Copies from pinned memory to CUDA devices can run asynchronously,
+    # overlapping with kernels that are still queued on the device.
+    if torch.device(device).type == "cuda":
+        return tensor.pin_memory().to(device, non_blocking=True)
+    return tensor.to(device)
+
+
 def dict2tensor(
-    x: dict, device: str = "cpu", dtype: torch.dtype = torch.float32
+    x: dict,
+    device: str = "cpu",
+    dtype: torch.dtype = torch.float32,
+    buffer: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     """
     Convert a dictionary to a tensor.
@@ -22,12 +39,24 @@ def dict2tensor(
         Device.
     dtype
         Dtype.
+    buffer
+        Preallocated tensor of shape `(1, len(x))` that the values are
+        copied into. If given, the buffer's device and dtype take precedence
+        over `device` and `dtype` and the buffer itself is returned.
 
     Returns
     -------
         torch.Tensor
     """
-    return torch.tensor([list(x.values())], device=device, dtype=dtype)
+    if buffer is not None:
+        dtype = buffer.dtype
+    values = torch.from_numpy(
+        np.fromiter(x.values(), dtype=_numpy_dtype(dtype), count=len(x))
+    )
+    if buffer is not None:
+        buffer[0].copy_(values, non_blocking=True)
+        return buffer
+    return _to_device(values.unsqueeze(0), device)
 
 
 def float2tensor(
@@ -50,9 +79,10 @@ def float2tensor(
         torch.Tensor
     """
     if isinstance(y, dict):
-        return torch.tensor([list(y.values())], device=device, dtype=dtype)
+        output = torch.tensor([list(y.values())], dtype=dtype)
     else:
-        return torch.tensor([[y]], device=device, dtype=dtype)
+        output = torch.tensor([[y]], dtype=dtype)
+    return _to_device(output, device)
 
 
 def deque2rolling_tensor(
@@ -78,8 +108,10 @@ def deque2rolling_tensor(
     -------
         torch.Tensor
     """
-    output = torch.tensor(window, device=device, dtype=dtype)
-    return torch.unsqueeze(output, 1)
+    # NumPy converts nested sequences considerably faster than the
+    # element-wise torch.tensor constructor.
+    output = torch.from_numpy(np.array(window, dtype=_numpy_dtype(dtype)))
+    return _to_device(torch.unsqueeze(output, 1), device)
 
 
 def df2tensor(
@@ -100,12 +132,19 @@ def df2tensor(
     -------
         torch.Tensor
     """
-    return torch.tensor(X.values, device=device, dtype=dtype)
+    values = np.ascontiguousarray(
+        X.to_numpy(dtype=_numpy_dtype(dtype), copy=False)
+    )
+    if not values.flags.writeable:
+        values = values.copy()
+    return _to_device(torch.from_numpy(values), device)
 
 
 def labels2onehot(
     y: Union[base.typing.ClfTarget, pd.Series],
-    classes: OrderedSet[base.typing.ClfTarget],
+    classes: Union[
+        OrderedSet[base.typing.ClfTarget], Dict[base.typing.ClfTarget, int]
+    ],
     n_classes: Optional[int] = None,
     device="cpu",
     dtype=torch.float32,
@@ -118,7 +157,7 @@ def labels2onehot(
     y
         Label or list of labels.
     classes
-        Classes.
+        Classes, or a dictionary mapping each class to its position.
     n_classes
         Number of classes.
     device
@@ -132,43 +171,37 @@ def labels2onehot(
     """
     if n_classes is None:
         n_classes = len(classes)
-    if isinstance(y, pd.Series):
-        onehot = torch.zeros(len(y), n_classes, device=device, dtype=dtype)
-        pos_idcs = [classes.index(y_i) for y_i in y]
-        for i, pos_idx in enumerate(pos_idcs):
-            if isinstance(pos_idx, int) and pos_idx < n_classes:
-                onehot[i, pos_idx] = 1
-    else:
-        onehot = torch.zeros(1, n_classes, device=device, dtype=dtype)
-        pos_idx = classes.index(y)
-        if isinstance(pos_idx, int) and pos_idx < n_classes:
-            onehot[0, pos_idx] = 1
-
-    return onehot
+    class_to_idx = classes.map if isinstance(classes, OrderedSet) else classes
+    labels = y if isinstance(y, (pd.Series, list)) else [y]
+    pos_idcs = _to_device(
+        torch.tensor([class_to_idx[y_i] for y_i in labels], dtype=torch.long),
+        device,
+    )
+    # Labels whose position exceeds `n_classes` are scattered into surplus
+    # columns that are sliced off afterwards, leaving their rows all zero.
+    onehot = torch.zeros(
+        len(labels), max(n_classes, len(classes)), device=device, dtype=dtype
+    )
+    onehot.scatter_(1, pos_idcs.unsqueeze(1), 1)
+    return onehot[:, :n_classes]
 
 
 def output2proba(
     preds: torch.Tensor, classes: OrderedSet, with_logits=False
 ) -> List[Dict[ClfTarget, float]]:
     if with_logits:
-        if preds.shape[-1] >= 1:
+        if preds.shape[-1] > 1:
             preds = torch.softmax(preds, dim=-1)
         else:
-            preds = torch.sigmoid(preds)
-
-    preds_np = preds.detach().numpy()
-    if preds_np.shape[1] == 1:
-        preds_np = np.hstack((preds_np, 1 - preds_np))
-    n_unobserved_classes = preds_np.shape[1] - len(classes)
+            # As sigmoid(-x) = 1 - sigmoid(x), this yields the probabilities
+            # of both classes with a single operation.
+            preds = torch.sigmoid(torch.cat([preds, -preds], dim=-1))
+    elif preds.shape[-1] == 1:
+        preds = torch.cat([preds, 1 - preds], dim=-1)
+    labels: Sequence[ClfTarget] = classes
+    n_unobserved_classes = preds.shape[-1] - len(classes)
     if n_unobserved_classes > 0:
-        classes = classes.copy()
-        [
-            classes.append(f"unobserved {i}")
-            for i in range(n_unobserved_classes)
+        labels = list(classes) + [
+            f"unobserved {i}" for i in range(n_unobserved_classes)
         ]
-    probas = (
-        dict(zip(classes, preds_np[0]))
-        if preds_np.shape[0] == 1
-        else [dict(zip(classes, pred)) for pred in preds_np]
-    )
-    return [probas] if isinstance(probas, dict) else list(probas)
+    return [dict(zip(labels, pred)) for pred in preds.detach().cpu().tolist()]
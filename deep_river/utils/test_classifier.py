@@ -0,0 +1,260 @@
+import warnings
+
+import pandas as pd
+import pytest
+import torch
+
+from deep_river.classification import (
+    Classifier,
+    LogisticRegression,
+    RollingClassifier,
+)
+from deep_river.classification.classifier import _TestModule
+from deep_river.classification.rolling_classifier import _TestLSTM
+
+
+def test_rolling_classifier_normalizes_logits():
+    model = RollingClassifier(module=_TestLSTM, window_size=3)
+    for i in range(6):
+        model.learn_one({"a": float(i), "b": 1.0}, i % 2 == 0)
+
+    proba = model.predict_proba_one({"a": 1.0, "b": 2.0})
+    assert sum(proba.values()) == pytest.approx(1.0)
+
+    probas = model.predict_proba_many(
+        pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [3.0, 4.0, 5.0]})
+    )
+    assert list(probas.sum(axis=1)) == pytest.approx([1.0, 1.0, 1.0])
+
+
+class _SoftmaxModule(torch.nn.Module):
+    def __init__(self, n_features):
+        super().__init__()
+        self.dense0 = torch.nn.Linear(n_features, 1)
+        self.softmax = torch.nn.Softmax(dim=-1)
+
+    def forward(self, X):
+        return self.softmax(self.dense0(X))
+
+
+def test_output_layer_growth():
+    model = LogisticRegression(is_class_incremental=True)
+    out_features = []
+    for y in range(7):
+        model.learn_one({"a": float(y), "b": 1.0}, y)
+        out_features.append(model.output_layer.out_features)
+    # Logits are grown geometrically once there are more than two classes.
+    assert out_features == [1, 1, 3, 6, 6, 6, 12]
+    assert model._n_outputs == 7
+    assert model._select_outputs(torch.zeros(2, 12)).shape == (2, 7)
+
+    proba = model.predict_proba_one({"a": 1.0, "b": 2.0})
+    assert list(proba) == list(range(7))
+    assert sum(proba.values()) == pytest.approx(1.0)
+
+    # Reserved units would distort an activation inside the model.
+    model = Classifier(
+        module=_SoftmaxModule, output_is_logit=False, is_class_incremental=True
+    )
+    for y in range(5):
+        model.learn_one({"a": float(y), "b": 1.0}, y)
+    assert model.output_layer.out_features == 5
+    proba = model.predict_proba_one({"a": 1.0, "b": 2.0})
+    assert sum(proba.values()) == pytest.approx(1.0)
+
+
+class _RNNLinearModule(torch.nn.Module):
+    def __init__(self, n_features):
+        super().__init__()
+        self.rnn = torch.nn.RNN(n_features, 4)
+        self.dense0 = torch.nn.Linear(4, 1)
+
+    def forward(self, X):
+        output, hn = self.rnn(X)
+        return self.dense0(hn[-1])
+
+
+def test_rolling_output_layer_growth():
+    model = RollingClassifier(
+        module=_RNNLinearModule, window_size=2, is_class_incremental=True
+    )
+    out_features = []
+    for y in range(7):
+        model.learn_one({"a": float(y), "b": 1.0}, y)
+        out_features.append(model.output_layer.out_features)
+    assert out_features == [1, 1, 3, 6, 6, 6, 12]
+    assert model._n_outputs == 7
+    proba = model.predict_proba_one({"a": 1.0, "b": 2.0})
+    assert list(proba) == list(range(7))
+    assert sum(proba.values()) == pytest.approx(1.0)
+
+
+def test_cuda_graph_is_ignored_on_cpu():
+    def train(cuda_graph):
+        model = Classifier(module=_TestModule, cuda_graph=cuda_graph)
+        for i in range(2 * Classifier._GRAPH_WARMUP_STEPS):
+            model.learn_one({"a": float(i), "b": 1.0}, i % 2)
+        return model
+
+    graph_model = train(cuda_graph=True)
+    assert graph_model._graph is None
+    assert graph_model._n_static_steps == 0
+    eager_model = train(cuda_graph=False)
+    for p_graph, p_eager in zip(
+        graph_model.module.parameters(), eager_model.module.parameters()
+    ):
+        assert torch.equal(p_graph, p_eager)
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+def test_cuda_graph_matches_eager_training():
+    def train(cuda_graph):
+        model = Classifier(
+            module=_TestModule, device="cuda", cuda_graph=cuda_graph
+        )
+        # Capture a graph, then interleave eager steps of another shape with
+        # replayed steps.
+        for i in range(12):
+            model.learn_one({"a": float(i), "b": 1.0}, i % 2)
+        model.learn_many(
+            pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]}), pd.Series([0, 1])
+        )
+        for i in range(3):
+            model.learn_one({"a": float(i), "b": 2.0}, i % 2)
+        return model
+
+    graph_model = train(cuda_graph=True)
+    assert graph_model._graph is not None
+    eager_model = train(cuda_graph=False)
+    for p_graph, p_eager in zip(
+        graph_model.module.parameters(), eager_model.module.parameters()
+    ):
+        assert torch.allclose(p_graph, p_eager, atol=1e-5)
+
+
+def test_binary_cross_entropy_on_logits_warns():
+    with pytest.warns(UserWarning, match="binary_cross_entropy_with_logits"):
+        model = Classifier(module=_TestModule, loss_fn="binary_cross_entropy")
+    assert (
+        model._loss_fn is torch.nn.functional.binary_cross_entropy_with_logits
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        Classifier(module=_TestModule)
+        RollingClassifier(module=_TestLSTM)
+        Classifier(
+            module=_SoftmaxModule,
+            loss_fn="binary_cross_entropy",
+            output_is_logit=False,
+        )
+
+
+def test_accumulation_steps():
+    model = Classifier(module=_TestModule, accumulation_steps=3)
+    targets = []
+
+    def loss_fn(y_pred, y):
+        targets.append(y)
+        return torch.nn.functional.binary_cross_entropy_with_logits(y_pred, y)
+
+    model._loss_fn = loss_fn
+    model.learn_one({"a": 1.0, "b": 2.0}, True)
+    n_steps = 0
+
+    def count_step(step):
+        def wrapper(*args, **kwargs):
+            nonlocal n_steps
+            n_steps += 1
+            return step(*args, **kwargs)
+
+        return wrapper
+
+    model.optimizer.step = count_step(model.optimizer.step)
+    model.learn_one({"a": 2.0, "b": 3.0}, False)
+    assert n_steps == 0
+    model.learn_one({"a": 3.0, "b": 4.0}, True)
+    assert n_steps == 1
+    assert targets[0].tolist() == [[1.0, 0.0], [0.0, 1.0], [1.0, 0.0]]
+
+    # Examples collected at the end of a stream are trained on explicitly.
+    model.learn_one({"a": 4.0, "b": 5.0}, False)
+    assert n_steps == 1
+    model.learn_pending()
+    assert n_steps == 2
+    assert targets[1].tolist() == [[0.0, 1.0]]
+    model.learn_pending()
+    assert n_steps == 2
+
+
+def test_quantize_for_inference():
+    model = LogisticRegression(is_class_incremental=True)
+    model.quantize_for_inference(refresh_interval=3)
+    x = {"a": 1.0, "b": 2.0}
+    for y in range(3):
+        model.learn_one(x, y)
+    model.predict_proba_one(x)
+    quantized = model._inference_module
+    layers = [
+        module
+        for module in quantized.modules()
+        if isinstance(module, torch.ao.nn.quantized.dynamic.Linear)
+    ]
+    assert len(layers) == 1
+    n_calls = 0
+
+    def count_call(module, input, output):
+        nonlocal n_calls
+        n_calls += 1
+
+    layers[0].register_forward_hook(count_call)
+    proba = model.predict_proba_one(x)
+    assert n_calls == 1
+    assert list(proba) == [0, 1, 2]
+
+    # The copy is only refreshed once it is outdated.
+    for _ in range(2):
+        model.learn_one(x, 0)
+    model.predict_proba_one(x)
+    assert model._inference_module is quantized
+    model.learn_one(x, 0)
+    model.predict_proba_one(x)
+    assert model._inference_module is not quantized
+
+    # Growing the output layer invalidates the copy immediately.
+    model.learn_one(x, 3)
+    assert model._inference_module is None
+    proba = model.predict_proba_one(x)
+    assert list(proba) == [0, 1, 2, 3]
+
+    model = LogisticRegression(device="cuda")
+    with pytest.raises(ValueError):
+        model.quantize_for_inference()
+
+
+def test_learn_iter_matches_learn_many():
+    chunks = [
+        (
+            pd.DataFrame({"a": [i, i + 1.0, i + 2.0], "b": [1.0, 0.0, 2.0]}),
+            pd.Series([i % 3, (i + 1) % 3, (i + 2) % 3]),
+        )
+        for i in range(4)
+    ]
+    # Models are seeded when they are created, so each one is trained
+    # before the next one is created.
+    iter_model = LogisticRegression(is_class_incremental=True)
+    iter_model.learn_iter(iter(chunks))
+    many_model = LogisticRegression(is_class_incremental=True)
+    for X, y in chunks:
+        many_model.learn_many(X, y)
+    for p_iter, p_many in zip(
+        iter_model.module.parameters(), many_model.module.parameters()
+    ):
+        assert torch.equal(p_iter, p_many)
+
+    probas = list(iter_model.predict_proba_iter(X for X, _ in chunks))
+    assert len(probas) == len(chunks)
+    for proba, (X, _) in zip(probas, chunks):
+        assert isinstance(proba, pd.DataFrame)
+        assert proba.shape == (len(X), 3)
+        pd.testing.assert_frame_equal(proba, many_model.predict_proba_many(X))
@@ -0,0 +1,68 @@
+import warnings
+
+import pytest
+import torch
+
+from deep_river.anomaly import Autoencoder
+from deep_river.anomaly.ae import _TestAutoencoder
+from deep_river.classification import (
+    Classifier,
+    LogisticRegression,
+    MultiLayerPerceptron,
+)
+from deep_river.regression import LinearRegression
+
+
+@pytest.mark.parametrize(
+    "estimator, learn, predict",
+    [
+        (
+            LogisticRegression(jit=True, is_class_incremental=True),
+            lambda model, x, i: model.learn_one(x, i),
+            "predict_proba_one",
+        ),
+        (
+            MultiLayerPerceptron(jit=True),
+            lambda model, x, i: model.learn_one(x, i % 2 == 0),
+            "predict_proba_one",
+        ),
+        (
+            LinearRegression(jit=True),
+            lambda model, x, i: model.learn_one(x, float(i)),
+            "predict_one",
+        ),
+        (
+            Autoencoder(module=_TestAutoencoder, jit=True),
+            lambda model, x, i: model.learn_one(x),
+            "score_one",
+        ),
+    ],
+)
+def test_predict_after_learn_with_jit(estimator, learn, predict):
+    x = {"a": 1.0, "b": 2.0, "c": 3.0}
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for i in range(4):
+            learn(estimator, x, i)
+            getattr(estimator, predict)(x)
+    assert isinstance(estimator.module, torch.jit.ScriptModule)
+
+
+class _UnscriptableModule(torch.nn.Module):
+    def __init__(self, n_features):
+        super().__init__()
+        self.dense0 = torch.nn.Linear(n_features, 1)
+
+    def forward(self, X, **kwargs):
+        return self.dense0(X)
+
+
+def test_jit_fallback_warns_once():
+    model = Classifier(
+        module=_UnscriptableModule, jit=True, is_class_incremental=True
+    )
+    with pytest.warns(UserWarning) as record:
+        for y in range(5):
+            model.learn_one({"a": 1.0, "b": 2.0}, y)
+    assert len(record) == 1
+    assert model.module is model._eager_module
@@ -0,0 +1,23 @@
+import pytest
+
+from deep_river.utils import prefetch
+
+
+def test_prefetch():
+    assert list(prefetch(range(10), lambda i: i * 2)) == list(range(0, 20, 2))
+    assert list(prefetch([], lambda i: i)) == []
+
+    results = prefetch(range(100), lambda i: i, size=1)
+    assert next(results) == 0
+    results.close()
+
+    def fail(i):
+        if i == 2:
+            raise ValueError("conversion failed")
+        return i
+
+    results = prefetch(range(5), fail)
+    assert next(results) == 0
+    assert next(results) == 1
+    with pytest.raises(ValueError, match="conversion failed"):
+        next(results)
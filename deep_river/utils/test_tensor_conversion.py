@@ -45,6 +45,7 @@ def test_deque2rolling_tensor():
         [[1, 1, 1]],
         [[1, 2, 3]],
     ]
+    assert deque2rolling_tensor(window).dtype == torch.float32
     assert list(window) == [
         [1, 1, 1],
         [1, 1, 1],
@@ -74,6 +75,13 @@ def test_labels2onehot():
         [1, 0, 0, 0],
         [0, 0, 1, 0],
     ]
+    assert labels2onehot(y1.tolist(), classes, n_classes=2).tolist() == [
+        [1, 0],
+        [0, 0],
+    ]
+
+    class_to_idx = {"first class": 0, "second class": 1}
+    assert labels2onehot("second class", class_to_idx).tolist() == [[0, 1]]
 
 
 def test_output2proba():
@@ -115,3 +123,8 @@ def test_output2proba():
             )
         ],
     )
+    y = torch.tensor([[np.log(3)]])
+    assert_dicts_almost_equal(
+        output2proba(y, classes, with_logits=True),
+        [{"first class": 0.75, "unobserved 0": 0.25}],
+    )